@@ -191,10 +191,12 @@ main() {
 
   rm -rf "${dest_dir}"
 
-  DESTDIR="$(pwd)/${dest_dir}" meson install --skip-subprojects -C "${build_dir}"
+  local dest_path="$(pwd)/${dest_dir}"
 
-  local data_dir="$(pwd)/${dest_dir}/data"
-  local exe_file="$(pwd)/${dest_dir}/pragtical"
+  DESTDIR="${dest_path}" meson install --skip-subprojects -C "${build_dir}"
+
+  local data_dir="${dest_path}/data"
+  local exe_file="${dest_path}/pragtical"
 
   local package_name=pragtical$version-$platform-$arch
   local bundle=false
@@ -204,7 +206,6 @@ main() {
   if [[ -d "${data_dir}" ]]; then
     echo "Creating a portable, compressed archive..."
     portable=true
-    exe_file="$(pwd)/${dest_dir}/pragtical"
     if [[ $platform == "windows" ]]; then
       exe_file="${exe_file}.exe"
       stripcmd="strip --strip-all"
@@ -212,16 +213,14 @@ main() {
       # MSYS2 ldd command seems to be only 64bit, so use ntldd
       # see https://github.com/msys2/MINGW-packages/issues/4164
       ntldd -R "${exe_file}" \
-        | grep mingw \
-        | awk '{print $3}' \
-        | sed 's#\\#/#g' \
-        | xargs -I '{}' cp -v '{}' "$(pwd)/${dest_dir}/"
+        | awk '/mingw/ { gsub(/\\/, "/", $3); print $3 }' \
+        | xargs -r -d '\n' cp -v -t "${dest_path}/"
     else
       # Windows archive is always portable
       package_name+="-portable"
     fi
-  elif [[ $platform == "macos" && ! -d "${data_dir}" ]]; then
-    data_dir="$(pwd)/${dest_dir}/Contents/Resources"
+  elif [[ $platform == "macos" ]]; then
+    data_dir="${dest_path}/Contents/Resources"
     if [[ -d "${data_dir}" ]]; then
       echo "Creating a macOS bundle application..."
       bundle=true
@@ -229,14 +228,15 @@ main() {
       if [[ $dmg == false ]]; then package_name+="-bundle"; fi
       rm -rf "Pragtical.app"; mv "${dest_dir}" "Pragtical.app"
       dest_dir="Pragtical.app"
-      exe_file="$(pwd)/${dest_dir}/Contents/MacOS/pragtical"
-      data_dir="$(pwd)/${dest_dir}/Contents/Resources"
+      dest_path="$(pwd)/${dest_dir}"
+      exe_file="${dest_path}/Contents/MacOS/pragtical"
+      data_dir="${dest_path}/Contents/Resources"
     fi
   fi
 
   if [[ $bundle == false && $portable == false ]]; then
-    data_dir="$(pwd)/${dest_dir}/$prefix/share/pragtical"
-    exe_file="$(pwd)/${dest_dir}/$prefix/bin/pragtical"
+    data_dir="${dest_path}/$prefix/share/pragtical"
+    exe_file="${dest_path}/$prefix/bin/pragtical"
   fi
 
   mkdir -p "${data_dir}"
@@ -250,8 +250,7 @@ main() {
   # distributions to avoid subprojects' include and lib directories to be copied.
   # Install Meson with PIP to get the latest version is not always possible.
   pushd "${dest_dir}"
-  find . -type d -name 'include' -prune -exec rm -rf {} \;
-  find . -type d -name 'lib' -prune -exec rm -rf {} \;
+  find . -type d \( -name 'include' -o -name 'lib' \) -prune -exec rm -rf {} +
   find . -type d -empty -delete
   popd
 